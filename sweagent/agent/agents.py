@@ -238,6 +238,9 @@ class AbstractAgent:
 
     def run(self, *args, **kwargs) -> AgentRunResult: ...
 
+    def reset(self) -> None:
+        """Clear per-instance state so the agent can be reused for another instance."""
+
 
 def get_agent_from_config(config: AgentConfig) -> AbstractAgent:
     if config.type == "default":
@@ -318,6 +321,13 @@ class RetryAgent(AbstractAgent):
         self._agent.setup(env=self._env, problem_statement=self._problem_statement, output_dir=sub_agent_output_dir)
         return self._agent
 
+    def reset(self) -> None:
+        """Clear per-instance state so the agent can be reused for another instance."""
+        self._i_attempt = 0
+        self._agent = None
+        self._attempt_data = []
+        self._total_instance_attempt_stats = InstanceStats()
+
     def _next_attempt(self) -> None:
         """Prepare for the next attempt: Reset the environment and setup the next agent."""
         assert self._env is not None
@@ -558,6 +568,21 @@ class DefaultAgent(AbstractAgent):
         self._chook.on_query_message_added(**item)
         self.history.append(item)  # type: ignore
 
+    def reset(self) -> None:
+        """Clear per-instance state so the agent can be reused for another instance.
+
+        `setup` starts a new trajectory but does not clear the conversation from
+        the previous instance: without this, a reused agent would prepend the old
+        history (system prompt, demos, every turn) to the new instance's messages
+        and keep accumulating `instance_cost` until the cost limit aborts the run.
+        """
+        self.history = []
+        self._trajectory = []
+        self.info = AgentInfo()
+        self.model.reset_stats()
+        self._n_consecutive_timeouts = 0
+        self._total_execution_time = 0.0
+
     def setup(
         self,
         env: SWEEnv,
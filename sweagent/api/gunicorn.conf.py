@@ -0,0 +1,28 @@
+"""Gunicorn configuration for the SWE-agent API server.
+
+Passed automatically by `run_from_cli` in `sweagent.api.server`.  Bind address,
+worker count and worker class come from the CLI; this file holds the settings
+that need to live in a config module.
+"""
+
+import os
+
+# Import the app (and, with SWE_AGENT_API_PRELOAD_AGENT set, the whole agent
+# stack) once in the master so forked workers share the pages copy-on-write
+# instead of paying N times the import cost and RSS.
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Pin each worker to one CPU to reduce cross-core cache thrash.
+
+    Only applies with multiple workers: pinning the default single-worker
+    deployment to one core would also confine its agent-run thread pool.
+    """
+    cpu_count = os.cpu_count() or 1
+    try:
+        if server.cfg.workers > 1:
+            os.sched_setaffinity(0, {worker.age % cpu_count})
+    except (AttributeError, OSError):
+        # Not on Linux, or affinity is restricted — run unpinned
+        pass
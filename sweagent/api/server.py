@@ -4,99 +4,440 @@ This module provides a Flask-based API server that allows the SWE-agent
 to be used as a backend for a GUI interface.
 
 Default port: 8000
+
+For anything but local development the app should be served through gunicorn
+(`gunicorn sweagent.api.server:app`) rather than the single-threaded werkzeug
+dev server; `run_from_cli` does this automatically when gunicorn is installed.
+
+Job state (the run registry, result cache and runner pool) is held in-process,
+so the server runs as a single gunicorn worker and scales request concurrency
+through gevent connections; with multiple workers a run queued on one worker
+would be invisible to /trajectory polls answered by another.
 """
 
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
 import os
+import queue
+import shutil
 import sys
+import threading
+import time
+import uuid
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib.util import find_spec
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from tempfile import mkdtemp
+from typing import TYPE_CHECKING
 
-from flask import Flask, jsonify, request
+import ijson
+import orjson
+from flask import Flask, Response, jsonify, request, stream_with_context
+from flask.json.provider import JSONProvider
+from pydantic import BaseModel, ValidationError
+from werkzeug.middleware.proxy_fix import ProxyFix
 
 # Add the parent directory to the path so we can import sweagent
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-# Import required modules
-from sweagent import PACKAGE_DIR
-from sweagent.run.run_single import RunSingle, RunSingleConfig
-from sweagent.agent.agents import AgentConfig, get_agent_from_config
-from sweagent.environment.swe_env import EnvironmentConfig, SWEEnv
-from sweagent.agent.problem_statement import (
-    EmptyProblemStatement,
-    ProblemStatement,
-    ProblemStatementConfig,
-)
-from sweagent.run.hooks.apply_patch import SaveApplyPatchHook
+# The package root is imported anyway when this module loads, so alias the
+# version once instead of re-running the import machinery inside handlers
+# (the import lock can serialize greenlets under gevent).
+from sweagent import __version__ as _VERSION
+
+if TYPE_CHECKING:
+    from sweagent.run.run_single import RunSingle
+
+# The agent/run modules pull in the whole model stack (litellm etc.), which
+# costs seconds of import time and hundreds of MB of RSS.  They are imported
+# lazily inside the functions that need them so that workers which only serve
+# the lightweight endpoints (/health, /version, /info) never pay for them.
+
+
+def warm_up() -> None:
+    """Import the heavy agent stack ahead of time.
+
+    Called at import time when SWE_AGENT_API_PRELOAD_AGENT is set so that,
+    combined with gunicorn's --preload, the import happens once in the master
+    and forked workers share the pages copy-on-write.
+    """
+    import sweagent.run.run_single  # noqa: F401
+
+
+if os.environ.get("SWE_AGENT_API_PRELOAD_AGENT"):
+    warm_up()
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    orjson encodes/decodes several times faster than the stdlib encoder, which
+    matters for the large trajectory payloads this API serves.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+# Trust one layer of reverse proxy so request.remote_addr and the scheme/host
+# reflect the real client rather than the proxy.
+app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1)
+
+
+class RunRequest(BaseModel):
+    """Payload of POST /run (and of each item in POST /batch-run).
+
+    Validated by pydantic's compiled core in one pass instead of a chain of
+    manual `.get()` checks; unknown fields are ignored for client
+    compatibility.
+    """
+
+    problem_statement: str
+    instance_id: str = "default-instance"
+    config: str | None = None
+
+
+class _Job:
+    """Bookkeeping for one queued agent run, polled via `/trajectory/<run_id>`."""
+
+    def __init__(self, run_id: str, instance_id: str):
+        self.run_id = run_id
+        self.instance_id = instance_id
+        self.status = "queued"
+        self.result: str | None = None
+        self.error: str | None = None
+        self.future = None
+        self.finished_at: float | None = None
+
+
+class _ResultCache:
+    """In-process TTL cache for completed agent runs.
+
+    Re-POSTing an identical problem statement is a multi-minute, multi-dollar
+    operation; a cache hit turns it into a dictionary lookup.  Set
+    `SWE_AGENT_API_CACHE_TTL=0` to disable caching.
+    """
+
+    def __init__(self, ttl: float | None = None):
+        if ttl is None:
+            ttl = float(os.environ.get("SWE_AGENT_API_CACHE_TTL", "86400"))
+        self._ttl = ttl
+        self._entries: dict[str, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(problem_statement: str, config_path: str | None) -> str:
+        digest = hashlib.blake2b(
+            problem_statement.encode() + str(config_path).encode(),
+            digest_size=16,
+        )
+        return "swe:" + digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+
+
+# Upper bound on concurrently executing agent runs.  Each run can hold a live
+# container plus agent state, so an unbounded burst could OOM the host; queued
+# runs simply wait for a token.
+_MAX_INFLIGHT = int(os.environ.get("SWE_AGENT_API_MAX_INFLIGHT", "16"))
+_INFLIGHT = threading.BoundedSemaphore(_MAX_INFLIGHT)
+_INFLIGHT_LOCK = threading.Lock()
+_inflight_count = 0
+
+
+def _inflight_depth() -> int:
+    """Number of agent runs currently executing (for observability via /info)."""
+    with _INFLIGHT_LOCK:
+        return _inflight_count
+
+
+_RESULT_CACHE = _ResultCache()
+_JOBS: dict[str, _Job] = {}
+_JOBS_LOCK = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the per-process worker pool, creating it on first use.
+
+    Created lazily so that gunicorn workers build their own pool after forking
+    instead of inheriting (broken) threads from the master process.
+    """
+    global _executor
+    with _JOBS_LOCK:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=int(os.environ.get("SWE_AGENT_API_MAX_WORKERS", os.cpu_count() or 1)),
+                thread_name_prefix="swe-agent-run",
+            )
+        return _executor
+
+
+def _run_cached(problem_statement: str, run_id: str, config_path: str | None = None) -> str:
+    """Run the agent, short-circuiting via the result cache for repeat problems.
+
+    Actual runs (cache misses) are gated by the in-flight semaphore so that at
+    most `_MAX_INFLIGHT` agent runs execute at once.
+    """
+    global _inflight_count
+    key = _ResultCache.key(problem_statement, config_path)
+    if (cached := _RESULT_CACHE.get(key)) is not None:
+        return cached
+    with _INFLIGHT:
+        with _INFLIGHT_LOCK:
+            _inflight_count += 1
+        try:
+            result = run_swe_agent(
+                problem_statement=problem_statement,
+                run_id=run_id,
+                config_path=config_path,
+            )
+        finally:
+            with _INFLIGHT_LOCK:
+                _inflight_count -= 1
+    _RESULT_CACHE.set(key, result)
+    return result
+
+
+def _enqueue_run(problem_statement: str, instance_id: str, config_path: str | None = None) -> _Job:
+    """Queue an agent run on the worker pool and return its job handle."""
+    job = _Job(run_id=uuid.uuid4().hex, instance_id=instance_id)
+    with _JOBS_LOCK:
+        _JOBS[job.run_id] = job
+
+    def _work() -> None:
+        job.status = "running"
+        try:
+            job.result = _run_cached(
+                problem_statement=problem_statement,
+                run_id=job.run_id,
+                config_path=config_path,
+            )
+        except Exception as e:
+            job.error = str(e)
+            job.status = "failed"
+        else:
+            job.status = "completed"
+        finally:
+            job.finished_at = time.time()
+
+    job.future = _get_executor().submit(_work)
+    return job
+
+
+def _etag_response(body: bytes, etag: str, cache_control: str | None = "public, max-age=3600"):
+    """Serve a precomputed JSON body with ETag/304 handling.
+
+    Skips dict construction and JSON encoding entirely on repeat hits, and
+    skips the body transfer when the client sends a matching If-None-Match.
+    """
+    if request.headers.get("If-None-Match") == etag:
+        return "", 304
+    headers = {"ETag": etag}
+    if cache_control is not None:
+        headers["Cache-Control"] = cache_control
+    return app.response_class(body, mimetype="application/json", headers=headers)
+
+
+@functools.cache
+def _health_payload() -> tuple[bytes, str]:
+    body = orjson.dumps({"status": "healthy", "service": "swe-agent-api"})
+    return body, hashlib.md5(body).hexdigest()
+
+
+@functools.cache
+def _version_payload() -> tuple[bytes, str]:
+    body = orjson.dumps({"version": _VERSION})
+    return body, hashlib.md5(body).hexdigest()
 
 
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint."""
-    return jsonify({"status": "healthy", "service": "swe-agent-api"})
+    # No Cache-Control: proxies must not serve stale health status
+    return _etag_response(*_health_payload(), cache_control=None)
 
 
 @app.route("/version", methods=["GET"])
 def get_version():
     """Get the SWE-agent version."""
-    from sweagent import __version__
+    return _etag_response(*_version_payload())
 
-    return jsonify({"version": __version__})
 
+_output_root: Path | None = None
+_RUNNER_POOL: dict[str, queue.SimpleQueue] = {}
+_RUNNER_POOL_LOCK = threading.Lock()
 
-def run_swe_agent(problem_statement: str, instance_id: str, config_path: str | None = None) -> str:
-    """Run the SWE-agent on a problem statement.
+# How long finished run output dirs are kept before the janitor deletes
+# them.  The output root lives on tmpfs where available, so this bounds RAM,
+# not disk.  <= 0 disables the janitor.
+_OUTPUT_MAX_AGE = float(os.environ.get("SWE_AGENT_API_OUTPUT_MAX_AGE", "3600"))
+_JANITOR_INTERVAL = 60.0
 
-    Args:
-        problem_statement: The issue description
-        instance_id: Unique identifier for this run
-        config_path: Optional path to config file
 
-    Returns:
-        Result string from the agent run
+def _get_output_root() -> Path:
+    """Shared output root for this process; one subdirectory per run.
+
+    Long-lived (unlike a per-call `TemporaryDirectory`) so that pooled runners
+    can keep writing trajectories to it across requests.  Placed on tmpfs
+    (`/dev/shm`) where available so trajectory and log writes never hit disk;
+    removed at interpreter exit, with a janitor thread reclaiming old run
+    directories in between.
+    """
+    global _output_root
+    with _RUNNER_POOL_LOCK:
+        if _output_root is None:
+            tmpfs = Path("/dev/shm")
+            _output_root = Path(mkdtemp(prefix="swe-agent-api-", dir=tmpfs if tmpfs.is_dir() else None))
+            atexit.register(shutil.rmtree, _output_root, ignore_errors=True)
+            if _OUTPUT_MAX_AGE > 0:
+                _start_output_janitor(_output_root)
+        return _output_root
+
+
+def _sweep_output_dirs(root: Path, max_age: float) -> None:
+    """Delete run output directories whose runs finished over `max_age` seconds ago.
+
+    Ages off job completion time rather than directory mtime: appending to an
+    existing trajectory file does not bump the directory mtime, so an
+    mtime-based sweep could delete a long run's output mid-run.  Directories
+    are keyed by run_id; those with a job still queued or running are never
+    touched, and directories with no known job (left over from a previous
+    process) fall back to the mtime check.
+
+    Expired jobs are also dropped from the registry, which would otherwise
+    grow without bound (with full result strings) in a long-lived server.
     """
+    cutoff = time.time() - max_age
+    with _JOBS_LOCK:
+        expired = {run_id for run_id, job in _JOBS.items() if job.finished_at is not None and job.finished_at < cutoff}
+        for run_id in expired:
+            del _JOBS[run_id]
+        live = set(_JOBS)
+    api_dir = root / "trajectories" / "api"
+    if not api_dir.is_dir():
+        return
+    for run_dir in api_dir.iterdir():
+        if run_dir.name in live:
+            continue
+        if run_dir.name not in expired:
+            try:
+                if run_dir.stat().st_mtime >= cutoff:
+                    continue
+            except OSError:
+                continue
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+
+def _start_output_janitor(root: Path) -> None:
+    """Start a daemon thread that periodically sweeps old run output."""
+
+    def _run() -> None:
+        while True:
+            time.sleep(_JANITOR_INTERVAL)
+            _sweep_output_dirs(root, _OUTPUT_MAX_AGE)
+
+    threading.Thread(target=_run, name="swe-agent-output-janitor", daemon=True).start()
+
+
+def _build_runner(config_path: str | None) -> RunSingle:
+    """Create a fresh `RunSingle` with the default agent/environment config."""
+    from sweagent.agent.agents import DefaultAgentConfig
+    from sweagent.agent.models import GenericAPIModelConfig
+    from sweagent.agent.problem_statement import EmptyProblemStatement
+    from sweagent.environment.swe_env import EnvironmentConfig
+    from sweagent.run.hooks.apply_patch import SaveApplyPatchHook
+    from sweagent.run.run_single import RunSingle, RunSingleConfig
     from sweagent.utils.config import load_environment_variables
 
-    # Create a temporary output directory
-    with TemporaryDirectory() as tmpdir:
-        output_dir = Path(tmpdir) / "trajectories" / "api" / instance_id
-        output_dir.mkdir(parents=True, exist_ok=True)
+    # Load environment variables if config path provided
+    if config_path:
+        load_environment_variables(Path(config_path))
+
+    run_config = RunSingleConfig(
+        env=EnvironmentConfig(),
+        # AgentConfig is a union type and DefaultAgentConfig has no default
+        # model, so spell out a concrete default agent here
+        agent=DefaultAgentConfig(
+            model=GenericAPIModelConfig(name=os.environ.get("SWE_AGENT_API_MODEL", "gpt-4o")),
+        ),
+        problem_statement=EmptyProblemStatement(),
+        output_dir=_get_output_root() / "trajectories" / "api",
+    )
+    runner = RunSingle.from_config(run_config)
+    runner.add_hook(SaveApplyPatchHook(apply_patch_locally=False))
+    return runner
 
-        # Create problem statement config
-        problem_config = EmptyProblemStatement()
-        problem_config = ProblemStatement.model_validate(
-            {"description": problem_statement, "id": instance_id}
-        )
 
-        # Create agent config (default)
-        agent_config = AgentConfig()
+def _checkout_runner(config_path: str | None) -> RunSingle:
+    """Take a pooled runner for this config, building one if the pool is empty."""
+    with _RUNNER_POOL_LOCK:
+        pool = _RUNNER_POOL.setdefault(str(config_path), queue.SimpleQueue())
+    try:
+        return pool.get_nowait()
+    except queue.Empty:
+        return _build_runner(config_path)
 
-        # Create environment config (default)
-        env_config = EnvironmentConfig()
 
-        # Create run config
-        run_config = RunSingleConfig(
-            env=env_config,
-            agent=agent_config,
-            problem_statement=problem_config,
-            output_dir=output_dir,
-        )
+def _checkin_runner(config_path: str | None, runner: RunSingle) -> None:
+    """Return a runner to its pool for reuse by the next request."""
+    _RUNNER_POOL[str(config_path)].put(runner)
+
+
+def run_swe_agent(problem_statement: str, run_id: str, config_path: str | None = None) -> str:
+    """Run the SWE-agent on a problem statement.
+
+    Config parsing and agent construction are a large fixed cost, so runners
+    are pooled per config and reused across requests instead of being rebuilt
+    for every call.  (The environment is not amortized: `RunSingle.run` closes
+    it after each run, so every run pays its own container start.)
+
+    Args:
+        problem_statement: The issue description
+        run_id: Unique identifier for this run; also keys the output directory
+            (client-supplied instance ids can collide across concurrent runs)
+        config_path: Optional path to config file
+
+    Returns:
+        Result string from the agent run
+    """
+    from sweagent.agent.problem_statement import TextProblemStatement
 
-        # Load environment variables if config path provided
-        if config_path:
-            load_environment_variables(Path(config_path))
+    # Handlers have already validated the payload, so build the problem
+    # statement directly instead of re-validating
+    problem_config = TextProblemStatement(text=problem_statement, id=run_id)
 
-        # Create and run the agent
-        run_single = RunSingle.from_config(run_config)
-        run_single.add_hook(SaveApplyPatchHook(apply_patch_locally=False))
-        run_single.run()
+    runner = _checkout_runner(config_path)
+    try:
+        runner.reset(problem_config)
+        runner.run()
+    finally:
+        _checkin_runner(config_path, runner)
 
-        # Return result
-        return f"Completed successfully. Output directory: {output_dir}"
+    return f"Completed successfully. Output directory: {runner.output_dir / run_id}"
 
 
 @app.route("/run", methods=["POST"])
@@ -111,38 +452,24 @@ def run_agent():
     }
     """
     try:
-        data = request.get_json()
-
-        if not data:
-            return jsonify({"error": "No JSON data provided"}), 400
-
-        problem_statement = data.get("problem_statement")
-        if not problem_statement:
-            return jsonify({"error": "problem_statement is required"}), 400
-
-        instance_id = data.get("instance_id", "default-instance")
-        config_path = data.get("config", None)
-
         try:
-            # Run the agent
-            result = run_swe_agent(
-                problem_statement=problem_statement,
-                instance_id=instance_id,
-                config_path=config_path,
-            )
-
-            return jsonify({
-                "status": "success",
-                "instance_id": instance_id,
-                "result": result
-            })
+            req = RunRequest.model_validate_json(request.get_data())
+        except ValidationError as e:
+            return jsonify({"error": e.errors(include_url=False)}), 400
+
+        # Queue the run instead of blocking the HTTP worker for its duration;
+        # clients poll /trajectory/<run_id> for status and result.
+        job = _enqueue_run(
+            problem_statement=req.problem_statement,
+            instance_id=req.instance_id,
+            config_path=req.config,
+        )
 
-        except Exception as e:
-            return jsonify({
-                "status": "error",
-                "instance_id": instance_id,
-                "error": str(e)
-            }), 500
+        return jsonify({
+            "status": "accepted",
+            "run_id": job.run_id,
+            "instance_id": req.instance_id
+        }), 202
 
     except Exception as e:
         return jsonify({
@@ -151,9 +478,158 @@ def run_agent():
         }), 500
 
 
+@app.route("/trajectory/<run_id>", methods=["GET"])
+def get_trajectory(run_id: str):
+    """Stream the status (and result, once finished) of a queued run.
+
+    The response is progressive newline-delimited JSON: the first line carries
+    the fields a poller needs (status, result, error), later lines carry the
+    heavy per-step trajectory data.  A polling client can read line one and
+    close the connection; a client that wants everything keeps reading.
+    """
+    with _JOBS_LOCK:
+        job = _JOBS.get(run_id)
+
+    if job is None:
+        return jsonify({"error": f"Unknown run_id: {run_id}"}), 404
+
+    def _generate():
+        critical = {
+            "priority": "critical",
+            "run_id": job.run_id,
+            "instance_id": job.instance_id,
+            "status": job.status,
+        }
+        if job.result is not None:
+            critical["result"] = job.result
+        if job.error is not None:
+            critical["error"] = job.error
+        yield orjson.dumps(critical) + b"\n"
+
+        traj_path = _find_trajectory_file(job.run_id)
+        if traj_path is not None:
+            for step in _iter_trajectory_steps(traj_path):
+                yield orjson.dumps({"priority": "low", "step": step}) + b"\n"
+
+    return Response(stream_with_context(_generate()), mimetype="application/x-ndjson")
+
+
+_EVENT_POLL_INTERVAL = 0.5
+
+
+@app.route("/trajectory/<run_id>/events", methods=["GET"])
+def get_trajectory_events(run_id: str):
+    """Stream status transitions of a run as Server-Sent Events.
+
+    Replaces fixed-interval client polling: the client holds one long-lived
+    connection and learns about completion within `_EVENT_POLL_INTERVAL`
+    instead of a full poll interval later.  The stream closes once the run
+    reaches a terminal state.
+    """
+    with _JOBS_LOCK:
+        job = _JOBS.get(run_id)
+
+    if job is None:
+        return jsonify({"error": f"Unknown run_id: {run_id}"}), 404
+
+    def _generate():
+        last_status = None
+        while True:
+            status = job.status
+            if status != last_status:
+                payload = {"run_id": job.run_id, "status": status}
+                if job.result is not None:
+                    payload["result"] = job.result
+                if job.error is not None:
+                    payload["error"] = job.error
+                yield b"data: " + orjson.dumps(payload) + b"\n\n"
+                last_status = status
+            if status in ("completed", "failed"):
+                return
+            time.sleep(_EVENT_POLL_INTERVAL)
+
+    return Response(stream_with_context(_generate()), mimetype="text/event-stream")
+
+
+def _find_trajectory_file(run_id: str) -> Path | None:
+    """Locate the .traj file written for a run, if any.
+
+    Output directories are keyed by run_id (unique by construction):
+    instance ids collide across concurrent runs (the default instance id and
+    the batch auto-names repeat), which would serve one run's steps as
+    another's.
+    """
+    output_dir = _get_output_root() / "trajectories" / "api" / run_id
+    matches = sorted(output_dir.glob("**/*.traj"))
+    return matches[0] if matches else None
+
+
+def _iter_trajectory_steps(path: Path):
+    """Yield trajectory steps one at a time without loading the whole file.
+
+    Stops cleanly on malformed input instead of raising: the agent rewrites
+    the whole .traj file non-atomically after every step, so reading a running
+    job's trajectory can race the writer and see a truncated document.
+    Raising here would abort the chunked response mid-stream, after the status
+    line and headers have already been sent.
+    """
+    with path.open("rb") as f:
+        try:
+            yield from ijson.items(f, "trajectory.item", use_float=True)
+        except ijson.JSONError:
+            return
+
+
+def _iter_trajectory_lines(path: Path):
+    """Yield one JSON line per trajectory step."""
+    for step in _iter_trajectory_steps(path):
+        yield orjson.dumps(step) + b"\n"
+
+
+@app.route("/trajectory/<run_id>/file", methods=["GET"])
+def get_trajectory_file(run_id: str):
+    """Stream the trajectory file of a run as newline-delimited JSON.
+
+    Trajectory files can be tens of MB; streaming one step per line keeps
+    server memory flat and lets clients parse progressively instead of
+    buffering the whole document.
+    """
+    with _JOBS_LOCK:
+        job = _JOBS.get(run_id)
+
+    if job is None:
+        return jsonify({"error": f"Unknown run_id: {run_id}"}), 404
+
+    traj_path = _find_trajectory_file(job.run_id)
+    if traj_path is None:
+        return jsonify({"error": f"No trajectory file for run: {run_id}"}), 404
+
+    return Response(
+        stream_with_context(_iter_trajectory_lines(traj_path)),
+        mimetype="application/x-ndjson",
+    )
+
+
+class _RequestStream:
+    """Minimal file-like adapter around `request.stream` for ijson.
+
+    werkzeug's limited stream interprets `read(0)` (which ijson uses to probe
+    whether the stream yields bytes) as a client disconnect, so answer that
+    probe without touching the underlying stream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        return self._stream.read(size)
+
+
 @app.route("/batch-run", methods=["POST"])
 def run_batch_agent():
-    """Run the SWE-agent on multiple problem statements.
+    """Queue agent runs for multiple problem statements.
 
     Expected JSON payload:
     {
@@ -162,45 +638,78 @@ def run_batch_agent():
             ...
         ]
     }
+
+    The payload is parsed incrementally from the request stream and each
+    problem is queued on the worker pool as soon as it is parsed, so server
+    memory stays constant in the batch size.  By default the response streams
+    one NDJSON result line per run as it completes, so clients can process
+    early finishers while the rest are still running; clients that send
+    `Accept: application/json` get the legacy aggregated response instead.
     """
     try:
-        data = request.get_json()
-
-        if not data:
-            return jsonify({"error": "No JSON data provided"}), 400
-
-        problems = data.get("problems", [])
+        jobs = []
+        try:
+            stream = _RequestStream(request.stream)
+            for i, problem in enumerate(ijson.items(stream, "problems.item", use_float=True)):
+                if isinstance(problem, dict):
+                    problem.setdefault("instance_id", f"instance-{i}")
+                try:
+                    req = RunRequest.model_validate(problem)
+                except ValidationError as e:
+                    # Earlier items are already queued; report them with the error
+                    return jsonify({
+                        "error": f"problems[{i}] is invalid",
+                        "details": e.errors(include_url=False),
+                        "run_ids": [job.run_id for job in jobs]
+                    }), 400
+                jobs.append(
+                    _enqueue_run(
+                        problem_statement=req.problem_statement,
+                        instance_id=req.instance_id,
+                        config_path=req.config,
+                    )
+                )
+        except ijson.JSONError:
+            return jsonify({"error": "Invalid JSON payload"}), 400
 
-        if not isinstance(problems, list) or len(problems) == 0:
+        if not jobs:
             return jsonify({"error": "problems must be a non-empty list"}), 400
 
-        results = []
-        for i, problem in enumerate(problems):
-            problem_statement = problem.get("problem_statement")
-            instance_id = problem.get("instance_id", f"instance-{i}")
-
-            try:
-                result = run_swe_agent(
-                    problem_statement=problem_statement,
-                    instance_id=instance_id,
-                )
-                results.append({
-                    "instance_id": instance_id,
-                    "status": "success",
-                    "result": result
-                })
-            except Exception as e:
-                results.append({
-                    "instance_id": instance_id,
-                    "status": "error",
-                    "error": str(e)
-                })
+        future_to_job = {job.future: job for job in jobs}
+
+        accept = request.accept_mimetypes
+        if accept["application/json"] > accept["application/x-ndjson"]:
+            # Legacy aggregated form: block until every run has finished
+            results = []
+            for future in as_completed(future_to_job):
+                job = future_to_job[future]
+                entry = {"instance_id": job.instance_id, "run_id": job.run_id}
+                if job.status == "completed":
+                    entry |= {"status": "success", "result": job.result}
+                else:
+                    entry |= {"status": "error", "error": job.error}
+                results.append(entry)
+            return jsonify({
+                "status": "batch-complete",
+                "total": len(results),
+                "results": results
+            })
 
-        return jsonify({
-            "status": "batch-complete",
-            "total": len(results),
-            "results": results
-        })
+        def _stream():
+            for future in as_completed(future_to_job):
+                job = future_to_job[future]
+                line = {
+                    "run_id": job.run_id,
+                    "instance_id": job.instance_id,
+                    "status": job.status,
+                }
+                if job.result is not None:
+                    line["result"] = job.result
+                if job.error is not None:
+                    line["error"] = job.error
+                yield orjson.dumps(line, option=orjson.OPT_APPEND_NEWLINE)
+
+        return Response(stream_with_context(_stream()), mimetype="application/x-ndjson")
 
     except Exception as e:
         return jsonify({
@@ -209,26 +718,43 @@ def run_batch_agent():
         }), 500
 
 
-@app.route("/info", methods=["GET"])
-def get_info():
-    """Get information about the SWE-agent setup."""
-    from sweagent import __version__
-
-    return jsonify({
+@functools.cache
+def _info_static() -> dict:
+    return {
         "service": "swe-agent-api",
-        "version": __version__,
+        "version": _VERSION,
         "endpoints": {
             "/health": "GET - Health check",
             "/version": "GET - Get version",
-            "/run": "POST - Run agent on problem",
+            "/run": "POST - Queue an agent run, returns a run_id",
+            "/trajectory/<run_id>": "GET - Poll status/result of a run",
+            "/trajectory/<run_id>/file": "GET - Stream trajectory steps as NDJSON",
+            "/trajectory/<run_id>/events": "GET - Stream status transitions as SSE",
             "/batch-run": "POST - Run agent on multiple problems",
             "/info": "GET - Get this info"
         }
-    })
+    }
+
 
+@app.route("/info", methods=["GET"])
+def get_info():
+    """Get information about the SWE-agent setup."""
+    # The in-flight gauge makes this dynamic, so the ETag is content-derived
+    # and there is no Cache-Control; 304s still apply while the depth is stable.
+    body = orjson.dumps(
+        _info_static() | {"inflight": {"current": _inflight_depth(), "max": _MAX_INFLIGHT}}
+    )
+    return _etag_response(body, hashlib.md5(body).hexdigest(), cache_control=None)
 
+
+@functools.cache
 def get_parser():
-    """Get the argument parser for the API server."""
+    """Get the argument parser for the API server.
+
+    Built once per process: argparse setup is pure Python and adds
+    measurable cold-start cost when the server is spawned per-test or
+    restarted by a supervisor.
+    """
     parser = ArgumentParser(description="Run SWE-agent API server")
     parser.add_argument(
         "--host",
@@ -245,15 +771,87 @@ def get_parser():
     parser.add_argument(
         "--debug",
         action="store_true",
-        help="Enable debug mode"
+        help="Enable debug mode (uses the single-threaded werkzeug dev server)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of gunicorn workers (default: 1). Job state (run_ids, results, "
+            "the runner pool) lives in-process, so /trajectory polling only works on "
+            "the worker that accepted the run; scale request concurrency via gevent "
+            "worker connections instead of worker processes."
+        )
+    )
+    parser.add_argument(
+        "--worker-class",
+        type=str,
+        default="gevent" if find_spec("gevent") is not None else "sync",
+        help="Gunicorn worker class (default: gevent if installed, else sync)"
+    )
+    parser.add_argument(
+        "--preload-agent",
+        action="store_true",
+        help="Import the heavy agent stack at server start instead of on the first run"
     )
     return parser
 
 
+def _exec_gunicorn(host: str, port: int, workers: int, worker_class: str, preload_agent: bool = False) -> None:
+    """Replace the current process with a gunicorn master serving `app`.
+
+    No gevent monkey-patching happens on our side: gunicorn's gevent worker
+    patches the stdlib itself after forking, which is the only safe place —
+    patching at import time would run in the preloaded master (mutable
+    pre-fork state) and too late anyway, since importing `sweagent` already
+    pulls in socket/ssl.
+    """
+    if preload_agent:
+        os.environ["SWE_AGENT_API_PRELOAD_AGENT"] = "1"
+    argv = [
+        "gunicorn",
+        "--config", str(Path(__file__).resolve().parent / "gunicorn.conf.py"),
+        "--bind", f"{host}:{port}",
+        "--workers", str(workers),
+        "--worker-class", worker_class,
+        "--worker-connections", "1000",
+        "sweagent.api.server:app",
+    ]
+    os.execvp("gunicorn", argv)
+
+
 def run_from_cli(args: list[str] | None = None):
     """Run the API server from command line arguments."""
     parsed_args = get_parser().parse_args(args)
 
+    if not parsed_args.debug and shutil.which("gunicorn") is not None:
+        if parsed_args.workers > 1:
+            from sweagent.utils.log import get_logger
+
+            get_logger("swe-api", emoji="🌐").warning(
+                "Running %d workers: the job registry is per-process, so /trajectory "
+                "polling fails for runs accepted by a different worker. Use one worker "
+                "and scale via gevent connections unless you front this with sticky routing.",
+                parsed_args.workers,
+            )
+        _exec_gunicorn(
+            host=parsed_args.host,
+            port=parsed_args.port,
+            workers=parsed_args.workers,
+            worker_class=parsed_args.worker_class,
+            preload_agent=parsed_args.preload_agent,
+        )
+
+    if parsed_args.debug and parsed_args.host == "0.0.0.0":
+        from sweagent.utils.log import get_logger
+
+        get_logger("swe-api", emoji="🌐").warning(
+            "Debug mode enables the werkzeug debugger and reloader; "
+            "do not expose it on 0.0.0.0 in production."
+        )
+
+    # Fallback: werkzeug dev server (single-threaded, local development only)
     app.run(
         host=parsed_args.host,
         port=parsed_args.port,
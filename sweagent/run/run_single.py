@@ -49,7 +49,7 @@ from sweagent.run.hooks.abstract import CombinedRunHooks, RunHook
 from sweagent.run.hooks.apply_patch import SaveApplyPatchHook
 from sweagent.run.hooks.open_pr import OpenPRConfig, OpenPRHook
 from sweagent.utils.config import load_environment_variables
-from sweagent.utils.log import add_file_handler, get_logger
+from sweagent.utils.log import add_file_handler, get_logger, remove_file_handler
 
 
 class RunSingleActionConfig(BaseModel):
@@ -137,14 +137,10 @@ class RunSingle:
         See `from_config` for an example.
         """
         self.logger = get_logger("swea-run", emoji="🏃")
-        instance_id = problem_statement.id
-        _log_filename_template = f"{instance_id}.{{level}}.log"
-        for level in ["trace", "debug", "info"]:
-            add_file_handler(
-                output_dir / instance_id / _log_filename_template.format(level=level),
-                level=level,
-                id_=f"{instance_id}-{level}",
-            )
+        # Keep the generated handler ids so `reset` can detach the handlers
+        # before adding new ones (explicit ids would collide when several
+        # instances share an instance id, e.g. the API server's default).
+        self._log_handler_ids = self._add_log_file_handlers(output_dir, problem_statement.id)
         self.env = env
         self.agent = agent
         self.output_dir = output_dir
@@ -161,6 +157,15 @@ class RunSingle:
     def hooks(self) -> list[RunHook]:
         return self._chooks.hooks
 
+    def _add_log_file_handlers(self, output_dir: Path, instance_id: str) -> list[str]:
+        return [
+            add_file_handler(
+                output_dir / instance_id / f"{instance_id}.{level}.log",
+                level=level,
+            )
+            for level in ["trace", "debug", "info"]
+        ]
+
     @classmethod
     def from_config(cls, config: RunSingleConfig) -> Self:
         load_environment_variables(config.env_var_path)
@@ -185,6 +190,23 @@ class RunSingle:
         hook.on_init(run=self)
         self._chooks.add_hook(hook)
 
+    def reset(self, problem_statement: ProblemStatement | ProblemStatementConfig) -> None:
+        """Point this instance at a new problem statement so that it can be reused
+        for another `run()` without rebuilding the agent.
+
+        Note that `run()` closes the environment when it finishes, so the next
+        `run()` still pays for an environment start; reuse only amortizes config
+        and agent construction.
+        """
+        self.agent.reset()
+        self.problem_statement = problem_statement
+        # Detach the previous instance's file handlers first: leaving them
+        # attached would leak handlers/fds in a long-lived process and write
+        # every later run's log lines into the old instance's files.
+        for id_ in self._log_handler_ids:
+            remove_file_handler(id_)
+        self._log_handler_ids = self._add_log_file_handlers(self.output_dir, problem_statement.id)
+
     def run(self):
         self._chooks.on_start()
         self.logger.info("Starting environment")
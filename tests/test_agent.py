@@ -6,7 +6,7 @@ from swerex.runtime.dummy import DummyRuntime
 
 from sweagent import CONFIG_DIR
 from sweagent.agent.agents import DefaultAgent, DefaultAgentConfig
-from sweagent.agent.models import InstantEmptySubmitModelConfig, PredeterminedTestModel
+from sweagent.agent.models import InstanceStats, InstantEmptySubmitModelConfig, PredeterminedTestModel
 from sweagent.agent.problem_statement import EmptyProblemStatement, TextProblemStatement
 from sweagent.environment.swe_env import SWEEnv
 from sweagent.tools.parsing import FunctionCallingParser, Identity, ThoughtActionParser
@@ -107,6 +107,17 @@ def test_exit_model_error(dummy_env: SWEEnv, test_agent: DefaultAgent, tmp_path)
     assert r.info["exit_status"] == "exit_environment_error"  # type: ignore
 
 
+def test_reset_clears_per_instance_state(dummy_env: SWEEnv, default_agent: DefaultAgent, tmp_path):
+    a = default_agent
+    a.setup(dummy_env, EmptyProblemStatement())
+    a.model.stats.api_calls = 3
+    assert a.history
+    a.reset()
+    assert a.history == []
+    assert a.trajectory == []
+    assert a.model.stats == InstanceStats()
+
+
 def test_exit_format(dummy_env: SWEEnv, thought_action_agent: DefaultAgent, tmp_path):
     thought_action_agent.model = PredeterminedTestModel(["a", "b", "c", "d"])  # type: ignore
     r = thought_action_agent.run(
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from sweagent.api import server
+
+
+@pytest.fixture
+def client(monkeypatch):
+    server.app.config["TESTING"] = True
+    # Fresh result cache so tests don't see each other's runs
+    monkeypatch.setattr(server, "_RESULT_CACHE", server._ResultCache())
+    with server.app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def fake_agent(monkeypatch):
+    """Replace `run_swe_agent` with a fast fake so no environment is started."""
+    calls = []
+
+    def _fake(problem_statement: str, run_id: str, config_path: str | None = None) -> str:
+        calls.append((problem_statement, config_path))
+        return f"done: {problem_statement}"
+
+    monkeypatch.setattr(server, "run_swe_agent", _fake)
+    return calls
+
+
+def _poll_job(client, run_id: str) -> dict:
+    """Read the critical first line of the progressive trajectory stream."""
+    body = client.get(f"/trajectory/{run_id}").get_data(as_text=True)
+    return json.loads(body.splitlines()[0])
+
+
+def _wait_for_job(client, run_id: str, timeout: float = 5.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        data = _poll_job(client, run_id)
+        if data["status"] in ("completed", "failed"):
+            return data
+        time.sleep(0.01)
+    msg = f"Job {run_id} did not finish within {timeout}s"
+    raise AssertionError(msg)
+
+
+def test_health(client):
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "healthy"
+
+
+def test_version(client):
+    from sweagent import __version__
+
+    response = client.get("/version")
+    assert response.status_code == 200
+    assert response.get_json()["version"] == __version__
+
+
+def test_info(client):
+    response = client.get("/info")
+    assert response.status_code == 200
+    data = response.get_json()
+    assert "/run" in data["endpoints"]
+    assert data["inflight"] == {"current": 0, "max": server._MAX_INFLIGHT}
+
+
+def test_inflight_semaphore_bounds_concurrency(client, monkeypatch):
+    import threading
+
+    monkeypatch.setattr(server, "_INFLIGHT", threading.BoundedSemaphore(1))
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def _slow(problem_statement: str, run_id: str, config_path=None) -> str:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return "ok"
+
+    monkeypatch.setattr(server, "run_swe_agent", _slow)
+    run_ids = [
+        client.post("/run", json={"problem_statement": f"p{i}", "instance_id": f"sem-{i}"}).get_json()["run_id"]
+        for i in range(3)
+    ]
+    for run_id in run_ids:
+        assert _wait_for_job(client, run_id)["status"] == "completed"
+    assert max_running == 1
+
+
+def test_gunicorn_conf_post_fork():
+    import importlib.util
+    from types import SimpleNamespace
+
+    conf_path = Path(server.__file__).parent / "gunicorn.conf.py"
+    spec = importlib.util.spec_from_file_location("gunicorn_conf", conf_path)
+    conf = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(conf)
+
+    assert conf.preload_app is True
+    # Must not raise, whatever the platform supports
+    conf.post_fork(None, SimpleNamespace(age=1))
+
+
+def test_parser_defaults_to_single_worker():
+    # Job state is per-process; multiple workers would break /trajectory polling
+    assert server.get_parser().get_default("workers") == 1
+
+
+def test_proxy_fix_is_installed():
+    from werkzeug.middleware.proxy_fix import ProxyFix
+
+    assert isinstance(server.app.wsgi_app, ProxyFix)
+
+
+def test_version_etag_roundtrip(client):
+    first = client.get("/version")
+    etag = first.headers["ETag"]
+    assert etag
+    second = client.get("/version", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.get_data() == b""
+
+
+def test_run_requires_problem_statement(client):
+    response = client.post("/run", json={})
+    assert response.status_code == 400
+    assert response.get_json()["error"][0]["loc"] == ["problem_statement"]
+
+
+def test_batch_run_rejects_invalid_item(client, fake_agent):
+    problems = [{"problem_statement": "fine"}, {"instance_id": "missing-statement"}]
+    response = client.post("/batch-run", json={"problems": problems})
+    assert response.status_code == 400
+    data = response.get_json()
+    assert "problems[1]" in data["error"]
+    # The valid first item was already queued before the bad one was seen
+    assert len(data["run_ids"]) == 1
+
+
+def test_run_enqueues_and_completes(client, fake_agent):
+    response = client.post("/run", json={"problem_statement": "Fix the bug", "instance_id": "test-1"})
+    assert response.status_code == 202
+    data = response.get_json()
+    assert data["status"] == "accepted"
+    run_id = data["run_id"]
+
+    result = _wait_for_job(client, run_id)
+    assert result["status"] == "completed"
+    assert result["result"] == "done: Fix the bug"
+    assert fake_agent == [("Fix the bug", None)]
+
+
+def test_run_failure_is_reported(client, monkeypatch):
+    def _fail(**_kwargs) -> str:
+        msg = "agent exploded"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(server, "run_swe_agent", _fail)
+    run_id = client.post("/run", json={"problem_statement": "x"}).get_json()["run_id"]
+
+    result = _wait_for_job(client, run_id)
+    assert result["status"] == "failed"
+    assert "agent exploded" in result["error"]
+
+
+def test_run_result_is_cached(client, fake_agent):
+    for _ in range(2):
+        run_id = client.post("/run", json={"problem_statement": "same problem"}).get_json()["run_id"]
+        result = _wait_for_job(client, run_id)
+        assert result["status"] == "completed"
+    # Second POST with an identical problem statement is served from the cache
+    assert len(fake_agent) == 1
+
+
+def test_batch_run_streams_results(client, fake_agent):
+    problems = [{"problem_statement": f"problem {i}", "instance_id": f"batch-{i}"} for i in range(3)]
+    response = client.post("/batch-run", json={"problems": problems})
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    results = [json.loads(line) for line in response.get_data(as_text=True).splitlines() if line]
+    assert {r["instance_id"] for r in results} == {"batch-0", "batch-1", "batch-2"}
+    assert all(r["status"] == "completed" for r in results)
+
+
+def test_batch_run_legacy_aggregate(client, fake_agent):
+    problems = [{"problem_statement": "p", "instance_id": "agg-0"}]
+    response = client.post("/batch-run", json={"problems": problems}, headers={"Accept": "application/json"})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["status"] == "batch-complete"
+    assert data["total"] == 1
+    assert data["results"][0]["status"] == "success"
+
+
+def test_batch_run_rejects_empty(client):
+    response = client.post("/batch-run", json={"problems": []})
+    assert response.status_code == 400
+
+
+def test_batch_run_rejects_invalid_json(client):
+    response = client.post("/batch-run", data="{not json", content_type="application/json")
+    assert response.status_code == 400
+
+
+def test_trajectory_unknown_run_id(client):
+    response = client.get("/trajectory/does-not-exist")
+    assert response.status_code == 404
+
+
+def test_trajectory_file_is_streamed(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(server, "_output_root", tmp_path)
+    steps = [{"action": f"step {i}", "observation": "ok"} for i in range(3)]
+    traj_dir = tmp_path / "trajectories" / "api" / "stream-run"
+    traj_dir.mkdir(parents=True)
+    (traj_dir / "stream-run.traj").write_text(json.dumps({"environment": "main", "trajectory": steps}))
+
+    job = server._Job(run_id="stream-run", instance_id="stream-test")
+    monkeypatch.setitem(server._JOBS, "stream-run", job)
+
+    response = client.get("/trajectory/stream-run/file")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines() if line]
+    assert lines == steps
+
+
+def test_trajectory_streams_critical_line_first(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(server, "_output_root", tmp_path)
+    steps = [{"action": "ls", "observation": "files"}]
+    traj_dir = tmp_path / "trajectories" / "api" / "prog-run"
+    traj_dir.mkdir(parents=True)
+    (traj_dir / "prog-run.traj").write_text(json.dumps({"trajectory": steps}))
+
+    job = server._Job(run_id="prog-run", instance_id="prog-test")
+    job.status = "completed"
+    monkeypatch.setitem(server._JOBS, "prog-run", job)
+
+    response = client.get("/trajectory/prog-run")
+    assert response.mimetype == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines[0]["priority"] == "critical"
+    assert lines[0]["status"] == "completed"
+    assert [line["step"] for line in lines[1:]] == steps
+
+
+def test_trajectory_tolerates_partial_writes(client, monkeypatch, tmp_path):
+    """A poll racing the agent's non-atomic .traj rewrite must not abort the stream."""
+    monkeypatch.setattr(server, "_output_root", tmp_path)
+    traj_dir = tmp_path / "trajectories" / "api" / "partial-run"
+    traj_dir.mkdir(parents=True)
+    # Truncated mid-write: complete first step, second step cut off
+    (traj_dir / "partial-run.traj").write_text(
+        '{"trajectory": [{"action": "ls", "observation": "files"}, {"action": "ca'
+    )
+
+    job = server._Job(run_id="partial-run", instance_id="partial-instance")
+    job.status = "running"
+    monkeypatch.setitem(server._JOBS, "partial-run", job)
+
+    response = client.get("/trajectory/partial-run")
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines[0]["status"] == "running"
+    # The complete step is served; the stream ends cleanly at the truncation
+    assert [line["step"] for line in lines[1:]] == [{"action": "ls", "observation": "files"}]
+
+    response = client.get("/trajectory/partial-run/file")
+    assert response.status_code == 200
+
+
+def test_trajectory_file_missing(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(server, "_output_root", tmp_path)
+    job = server._Job(run_id="no-file", instance_id="no-file-instance")
+    monkeypatch.setitem(server._JOBS, "no-file", job)
+    assert client.get("/trajectory/no-file/file").status_code == 404
+
+
+def test_trajectory_events_stream_until_terminal(client, fake_agent):
+    run_id = client.post("/run", json={"problem_statement": "events", "instance_id": "ev-1"}).get_json()["run_id"]
+    _wait_for_job(client, run_id)
+
+    response = client.get(f"/trajectory/{run_id}/events")
+    assert response.mimetype == "text/event-stream"
+    events = [
+        json.loads(line[len("data: "):])
+        for line in response.get_data(as_text=True).splitlines()
+        if line.startswith("data: ")
+    ]
+    assert events[-1]["status"] == "completed"
+    assert events[-1]["result"] == "done: events"
+
+
+def test_sweep_output_dirs(tmp_path):
+    api_dir = tmp_path / "trajectories" / "api"
+    old_dir = api_dir / "old-instance"
+    fresh_dir = api_dir / "fresh-instance"
+    old_dir.mkdir(parents=True)
+    fresh_dir.mkdir(parents=True)
+    two_hours_ago = time.time() - 7200
+    os.utime(old_dir, (two_hours_ago, two_hours_ago))
+
+    server._sweep_output_dirs(tmp_path, max_age=3600)
+
+    assert not old_dir.exists()
+    assert fresh_dir.exists()
+
+
+def test_sweep_respects_job_state(tmp_path, monkeypatch):
+    api_dir = tmp_path / "trajectories" / "api"
+    running_dir = api_dir / "r1"
+    done_dir = api_dir / "d1"
+    running_dir.mkdir(parents=True)
+    done_dir.mkdir(parents=True)
+    two_hours_ago = time.time() - 7200
+    os.utime(running_dir, (two_hours_ago, two_hours_ago))
+
+    running = server._Job(run_id="r1", instance_id="running-instance")
+    running.status = "running"
+    done = server._Job(run_id="d1", instance_id="done-instance")
+    done.status = "completed"
+    done.finished_at = two_hours_ago
+    # A job that failed before writing any output still expires
+    failed = server._Job(run_id="f1", instance_id="failed-instance")
+    failed.status = "failed"
+    failed.finished_at = two_hours_ago
+    monkeypatch.setattr(server, "_JOBS", {"r1": running, "d1": done, "f1": failed})
+
+    server._sweep_output_dirs(tmp_path, max_age=3600)
+
+    # An in-progress run is kept even with an old directory mtime...
+    assert running_dir.exists()
+    assert "r1" in server._JOBS
+    # ...while runs that finished long ago are removed despite a fresh mtime,
+    # and their registry entries are evicted with them
+    assert not done_dir.exists()
+    assert set(server._JOBS) == {"r1"}
+
+
+def test_server_import_is_lightweight():
+    """Importing the server must not drag in the agent/model stack."""
+    code = (
+        "import sys; import sweagent.api.server; "
+        "assert 'sweagent.run.run_single' not in sys.modules; "
+        "assert 'litellm' not in sys.modules"
+    )
+    subprocess.check_call([sys.executable, "-c", code])
+
+
+def test_build_runner_builds_default_config(monkeypatch, tmp_path):
+    """The default config must actually construct (no mocks): a regression here
+    means every real agent run fails at checkout time."""
+    from sweagent.run.run_single import RunSingle
+
+    monkeypatch.setattr(server, "_output_root", tmp_path)
+    runner = server._build_runner(None)
+    assert isinstance(runner, RunSingle)
+
+
+def test_runner_pool_reuses_instances(monkeypatch):
+    built = []
+
+    def _fake_build(config_path):
+        built.append(config_path)
+        return object()
+
+    monkeypatch.setattr(server, "_build_runner", _fake_build)
+    monkeypatch.setattr(server, "_RUNNER_POOL", {})
+
+    runner = server._checkout_runner(None)
+    server._checkin_runner(None, runner)
+    assert server._checkout_runner(None) is runner
+    # A different config gets its own pool
+    server._checkout_runner("/some/config.yaml")
+    assert built == [None, "/some/config.yaml"]
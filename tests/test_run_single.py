@@ -20,6 +20,30 @@ class RaisesExceptionHook(RunHook):
         raise ValueError(msg)
 
 
+def test_reset_replaces_log_file_handlers(tmp_path):
+    from types import SimpleNamespace
+
+    from sweagent.agent.problem_statement import TextProblemStatement
+    from sweagent.utils.log import _ADDITIONAL_HANDLERS, remove_file_handler
+
+    rs = RunSingle(
+        env=None,  # type: ignore[arg-type]
+        agent=SimpleNamespace(reset=lambda: None),  # type: ignore[arg-type]
+        problem_statement=TextProblemStatement(text="x", id="first"),
+        output_dir=Path(tmp_path),
+    )
+    first_ids = list(rs._log_handler_ids)
+    assert all(id_ in _ADDITIONAL_HANDLERS for id_ in first_ids)
+
+    rs.reset(TextProblemStatement(text="y", id="second"))
+    # The old handlers are detached, not accumulated
+    assert all(id_ not in _ADDITIONAL_HANDLERS for id_ in first_ids)
+    assert set(rs._log_handler_ids).isdisjoint(first_ids)
+
+    for id_ in rs._log_handler_ids:
+        remove_file_handler(id_)
+
+
 @pytest.mark.slow
 def test_run_single_raises_exception():
     rsc = RunSingleConfig(agent=DefaultAgentConfig(model=InstantEmptySubmitModelConfig()))
@@ -14,12 +14,38 @@ Usage:
 """
 
 import argparse
+import atexit
+import functools
 import json
+import logging
+import logging.handlers
+import queue
 import sys
-import time
-from typing import Any, Optional
+from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _setup_logging() -> logging.Logger:
+    """Configure non-blocking logging for the client.
+
+    Records go to an in-memory queue and a background listener thread writes
+    them out, so emitting a line never blocks the polling/event loop on a slow
+    stdout pipe.
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    atexit.register(listener.stop)
+    logger = logging.getLogger("poc")
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+log = _setup_logging()
 
 
 class SWEAgentAPIClient:
@@ -28,6 +54,15 @@ class SWEAgentAPIClient:
     def __init__(self, host: str = "localhost", port: int = 11400):
         self.base_url = f"http://{host}:{port}"
         self.session = requests.Session()
+        # Reuse connections across the polling loop (saves a TCP handshake per
+        # request) and retry transient server/gateway errors with backoff.
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(total=5, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def health_check(self) -> dict[str, Any]:
         """Check if the API server is running."""
@@ -39,7 +74,7 @@ class SWEAgentAPIClient:
         repo: str,
         issue: str,
         model_name: str = "gpt-4o",
-        config_path: Optional[str] = None,
+        config_path: str | None = None,
     ) -> dict[str, Any]:
         """Start the agent to work on a problem statement.
 
@@ -68,25 +103,91 @@ class SWEAgentAPIClient:
         return self._handle_response(response, "Failed to start agent run")
 
     def get_trajectory(self, run_id: str) -> dict[str, Any]:
-        """Get trajectory information for a specific run."""
+        """Get trajectory information for a specific run.
+
+        The server streams progressive NDJSON (critical fields first, then
+        per-step data); this merges the stream back into a single dict.
+        """
         response = self.session.get(
             f"{self.base_url}/trajectory/{run_id}",
+            stream=True,
             timeout=30,
         )
-        return self._handle_response(response, f"Failed to get trajectory: {run_id}")
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            msg = f"Failed to get trajectory: {run_id} - {response.text}"
+            raise Exception(msg) from e
+
+        lines = (json.loads(line) for line in response.iter_lines() if line)
+        result = next(lines, {})
+        trajectory = [line["step"] for line in lines if "step" in line]
+        if trajectory:
+            result["trajectory"] = trajectory
+            result["steps"] = len(trajectory)
+        return result
+
+    def get_trajectory_status(self, run_id: str) -> dict[str, Any]:
+        """Read only the critical first line of the trajectory stream.
+
+        The server emits status before any heavy trajectory data, so polling
+        costs one line of JSON regardless of trajectory size.
+        """
+        response = self.session.get(
+            f"{self.base_url}/trajectory/{run_id}",
+            stream=True,
+            timeout=30,
+        )
+        try:
+            response.raise_for_status()
+            return json.loads(next(response.iter_lines()))
+        except requests.HTTPError as e:
+            msg = f"Failed to get trajectory status: {run_id} - {response.text}"
+            raise Exception(msg) from e
+        finally:
+            response.close()
 
     def list_trajectories(self) -> list[dict[str, Any]]:
         """List all available trajectories."""
         response = self.session.get(f"{self.base_url}/trajectories", timeout=30)
         return self._handle_response(response, "Failed to list trajectories")
 
-    def get_trajectory_file(self, run_id: str) -> dict[str, Any]:
-        """Get the full trajectory file content."""
+    def get_trajectory_file(self, run_id: str) -> list[dict[str, Any]]:
+        """Get the trajectory file content, streamed one step per line.
+
+        The server sends newline-delimited JSON, so steps are parsed as they
+        arrive instead of buffering the whole (potentially huge) file.
+        """
         response = self.session.get(
             f"{self.base_url}/trajectory/{run_id}/file",
+            stream=True,
             timeout=30,
         )
-        return self._handle_response(response, f"Failed to get trajectory file: {run_id}")
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            msg = f"Failed to get trajectory file: {run_id} - {response.text}"
+            raise Exception(msg) from e
+        return [json.loads(line) for line in response.iter_lines() if line]
+
+    def stream_events(self, run_id: str, timeout: int = 300):
+        """Yield status events for a run from the server's SSE stream.
+
+        One long-lived connection replaces fixed-interval polling; the server
+        closes the stream once the run reaches a terminal state.
+        """
+        response = self.session.get(
+            f"{self.base_url}/trajectory/{run_id}/events",
+            stream=True,
+            timeout=timeout,
+        )
+        try:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line.startswith(b"data: "):
+                    yield json.loads(line[len(b"data: "):])
+        finally:
+            response.close()
 
     def stop_run(self, run_id: str) -> dict[str, Any]:
         """Stop an ongoing agent run."""
@@ -106,7 +207,8 @@ class SWEAgentAPIClient:
                 error_detail = f" - {response.json()}"
             except json.JSONDecodeError:
                 error_detail = f" - {response.text}"
-            raise Exception(f"{error_msg}{error_detail}") from e
+            msg = f"{error_msg}{error_detail}"
+            raise Exception(msg) from e
 
         if response.status_code == 204:  # No content
             return None
@@ -115,9 +217,9 @@ class SWEAgentAPIClient:
 
 def print_section(title: str) -> None:
     """Print a formatted section header."""
-    print("\n" + "=" * 60)
-    print(f" {title}")
-    print("=" * 60)
+    log.info("\n" + "=" * 60)
+    log.info(f" {title}")
+    log.info("=" * 60)
 
 
 def test_health_check(client: SWEAgentAPIClient) -> bool:
@@ -125,23 +227,23 @@ def test_health_check(client: SWEAgentAPIClient) -> bool:
     print_section("Test 1: Health Check")
     try:
         result = client.health_check()
-        print(f"API Status: {result.get('status', 'unknown')}")
-        print(f"Version: {result.get('version', 'unknown')}")
-        print("Health check: PASSED")
+        log.info(f"API Status: {result.get('status', 'unknown')}")
+        log.info(f"Version: {result.get('version', 'unknown')}")
+        log.info("Health check: PASSED")
         return True
     except Exception as e:
-        print(f"Health check: FAILED - {e}")
+        log.info(f"Health check: FAILED - {e}")
         return False
 
 
-def test_run_agent(client: SWEAgentAPIClient, test_issue: str) -> Optional[str]:
+def test_run_agent(client: SWEAgentAPIClient, test_issue: str) -> str | None:
     """Test starting an agent run."""
     print_section("Test 2: Run Agent")
     repo = "https://github.com/owner/test-repo"
 
     try:
-        print(f"Starting agent on repo: {repo}")
-        print(f"Issue: {test_issue[:100]}...")
+        log.info(f"Starting agent on repo: {repo}")
+        log.info(f"Issue: {test_issue[:100]}...")
 
         result = client.run_agent(
             repo=repo,
@@ -151,14 +253,14 @@ def test_run_agent(client: SWEAgentAPIClient, test_issue: str) -> Optional[str]:
 
         run_id = result.get("run_id")
         if run_id:
-            print(f"Run started with ID: {run_id}")
-            print(f"Status: {result.get('status', 'unknown')}")
+            log.info(f"Run started with ID: {run_id}")
+            log.info(f"Status: {result.get('status', 'unknown')}")
             return run_id
         else:
-            print(f"Run response: {result}")
+            log.info(f"Run response: {result}")
             return None
     except Exception as e:
-        print(f"Failed to start run: {e}")
+        log.info(f"Failed to start run: {e}")
         return None
 
 
@@ -167,40 +269,39 @@ def test_list_trajectories(client: SWEAgentAPIClient) -> bool:
     print_section("Test 3: List Trajectories")
     try:
         trajectories = client.list_trajectories()
-        print(f"Found {len(trajectories)} trajectory(s)")
+        log.info(f"Found {len(trajectories)} trajectory(s)")
         for traj in trajectories:
-            print(f"  - {traj.get('id', 'unknown')}: {traj.get('status', 'unknown')}")
-        print("List trajectories: PASSED")
+            log.info(f"  - {traj.get('id', 'unknown')}: {traj.get('status', 'unknown')}")
+        log.info("List trajectories: PASSED")
         return True
     except Exception as e:
-        print(f"List trajectories: FAILED - {e}")
+        log.info(f"List trajectories: FAILED - {e}")
         return False
 
 
 def wait_for_completion(client: SWEAgentAPIClient, run_id: str, timeout: int = 300) -> bool:
-    """Wait for an agent run to complete."""
-    print(f"Waiting for run {run_id} to complete (timeout: {timeout}s)...")
-    start_time = time.time()
+    """Wait for an agent run to complete via the server's event stream.
 
-    while time.time() - start_time < timeout:
-        try:
-            result = client.get_trajectory(run_id)
-            status = result.get("status", "unknown")
-            print(f"  Status: {status}")
+    Instead of polling every few seconds, this reads one long-lived SSE
+    connection, so completion is detected within the server's event interval.
+    """
+    log.info(f"Waiting for run {run_id} to complete (timeout: {timeout}s)...")
+
+    try:
+        for event in client.stream_events(run_id, timeout=timeout):
+            status = event.get("status", "unknown")
+            log.info(f"  Status: {status}")
 
             if status in ["completed", "success"]:
-                print("Run completed successfully!")
+                log.info("Run completed successfully!")
                 return True
             elif status in ["failed", "error"]:
-                print(f"Run failed with status: {status}")
+                log.info(f"Run failed with status: {status}")
                 return False
+    except Exception as e:
+        log.info(f"  Error waiting for completion: {e}")
 
-            time.sleep(5)
-        except Exception as e:
-            print(f"  Error checking status: {e}")
-            time.sleep(5)
-
-    print("Timeout waiting for run completion")
+    log.info("Timeout waiting for run completion")
     return False
 
 
@@ -216,7 +317,7 @@ The issue is in line 42 of main.py where 'result' is used without being initiali
     # Step 1: Start agent run
     run_id = test_run_agent(client, test_issue)
     if not run_id:
-        print("Demo aborted: Could not start run")
+        log.info("Demo aborted: Could not start run")
         return
 
     # Step 2: Wait for completion
@@ -227,14 +328,15 @@ The issue is in line 42 of main.py where 'result' is used without being initiali
         print_section("Step 3: Get Trajectory")
         try:
             traj = client.get_trajectory(run_id)
-            print(f"Trajectory status: {traj.get('status')}")
-            print(f"Steps completed: {traj.get('steps', 'N/A')}")
+            log.info(f"Trajectory status: {traj.get('status')}")
+            log.info(f"Steps completed: {traj.get('steps', 'N/A')}")
         except Exception as e:
-            print(f"Failed to get trajectory: {e}")
+            log.info(f"Failed to get trajectory: {e}")
 
 
-def main() -> int:
-    """Main entry point."""
+@functools.cache
+def get_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once per process."""
     parser = argparse.ArgumentParser(
         description="SWE-agent API Test Client",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -272,14 +374,19 @@ Examples:
         default=300,
         help="Timeout in seconds for waiting for runs (default: 300)",
     )
+    return parser
+
 
+def main() -> int:
+    """Main entry point."""
+    parser = get_parser()
     args = parser.parse_args()
 
     # Create client
     client = SWEAgentAPIClient(host=args.host, port=args.port)
 
     print_section("SWE-agent API Client")
-    print(f"Base URL: {client.base_url}")
+    log.info(f"Base URL: {client.base_url}")
 
     # Run selected test
     if args.test: